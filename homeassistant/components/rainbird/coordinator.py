@@ -28,8 +28,8 @@ _T = TypeVar("_T")
 class RainbirdDeviceState:
     """Data retrieved from a Rain Bird device."""
 
-    zones: set[int]
-    active_zones: set[int]
+    zones: frozenset[int]
+    active_zones: frozenset[int]
     rain: bool
     rain_delay: int
 
@@ -54,7 +54,7 @@ class RainbirdUpdateCoordinator(DataUpdateCoordinator[RainbirdDeviceState]):
         )
         self._controller = controller
         self._serial_number = serial_number
-        self._zones: set[int] | None = None
+        self._zones: frozenset[int] | None = None
 
     @property
     def controller(self) -> AsyncRainbirdController:
@@ -84,27 +84,37 @@ class RainbirdUpdateCoordinator(DataUpdateCoordinator[RainbirdDeviceState]):
             raise UpdateFailed(f"Error communicating with Device: {err}") from err
 
     async def _fetch_data(self) -> RainbirdDeviceState:
-        """Fetch data from the Rain Bird device."""
-        (zones, states, rain, rain_delay) = await asyncio.gather(
-            self._fetch_zones(),
+        """Fetch data from the Rain Bird device.
+
+        The available zones never change at runtime, so they are only fetched
+        from the device on the first refresh and the cached value is reused on
+        every poll after that.
+        """
+        zones = await self._fetch_zones()
+        (states, rain, rain_delay) = await asyncio.gather(
             self._controller.get_zone_states(),
             self._controller.get_rain_sensor_state(),
             self._controller.get_rain_delay(),
         )
+        # States has already expanded the wire bitmask into a tuple of bools,
+        # so scan that directly rather than calling states.active() per zone.
         return RainbirdDeviceState(
-            zones=set(zones),
-            active_zones={zone for zone in zones if states.active(zone)},
+            zones=zones,
+            active_zones=zones.intersection(
+                zone for zone, active in enumerate(states.states, start=1) if active
+            ),
             rain=rain,
             rain_delay=rain_delay,
         )
 
-    async def _fetch_zones(self) -> set[int]:
+    async def _fetch_zones(self) -> frozenset[int]:
         """Fetch the zones from the device, caching the results."""
         if self._zones is None:
             available_stations = await self._controller.get_available_stations()
-            self._zones = {
+            stations = available_stations.stations
+            self._zones = frozenset(
                 zone
-                for zone in range(1, available_stations.stations.count + 1)
-                if available_stations.stations.active(zone)
-            }
+                for zone, active in enumerate(stations.states[: stations.count], 1)
+                if active
+            )
         return self._zones
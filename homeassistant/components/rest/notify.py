@@ -1,11 +1,11 @@
 """RESTful platform for notify component."""
 from __future__ import annotations
 
-from http import HTTPStatus
+import copy
 import logging
+from typing import Any
 
-import requests
-from requests.auth import AuthBase, HTTPBasicAuth, HTTPDigestAuth
+import httpx
 import voluptuous as vol
 
 from homeassistant.components.notify import (
@@ -31,6 +31,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
@@ -70,6 +71,42 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 
 _LOGGER = logging.getLogger(__name__)
 
+# A compiled data tree: the tree with template leaves nulled out, plus the
+# path to each template so only those leaves are re-rendered per message.
+TemplatePlan = tuple[Any, list[tuple[tuple, Template]]]
+
+
+def _compile_template_plan(hass: HomeAssistant, tree: Any) -> TemplatePlan:
+    """Split a configured data tree into a static skeleton and its templates."""
+    templates: list[tuple[tuple, Template]] = []
+
+    def _walk(value: Any, path: tuple) -> Any:
+        if isinstance(value, list):
+            return [_walk(item, (*path, index)) for index, item in enumerate(value)]
+        if isinstance(value, dict):
+            return {key: _walk(item, (*path, key)) for key, item in value.items()}
+        if isinstance(value, Template):
+            value.hass = hass
+            templates.append((path, value))
+            return None
+        return value
+
+    return _walk(tree, ()), templates
+
+
+def _render_template_plan(plan: TemplatePlan, variables: dict[str, Any]) -> Any:
+    """Render a compiled data tree, touching only the template leaves."""
+    skeleton, templates = plan
+    if not templates:
+        return skeleton
+    rendered = copy.deepcopy(skeleton)
+    for path, template in templates:
+        target = rendered
+        for key in path[:-1]:
+            target = target[key]
+        target[path[-1]] = template.async_render(variables, parse_result=False)
+    return rendered
+
 
 def get_service(
     hass: HomeAssistant,
@@ -90,12 +127,12 @@ def get_service(
     password = config.get(CONF_PASSWORD)
     verify_ssl = config.get(CONF_VERIFY_SSL)
 
-    auth: AuthBase | None = None
+    auth: httpx.DigestAuth | tuple[str, str] | None = None
     if username and password:
         if config.get(CONF_AUTHENTICATION) == HTTP_DIGEST_AUTHENTICATION:
-            auth = HTTPDigestAuth(username, password)
+            auth = httpx.DigestAuth(username, password)
         else:
-            auth = HTTPBasicAuth(username, password)
+            auth = (username, password)
 
     return RestNotificationService(
         hass,
@@ -136,16 +173,26 @@ class RestNotificationService(BaseNotificationService):
         self._hass = hass
         self._method = method.upper()
         self._headers = headers
-        self._params = params
+        self._params = params or None
         self._message_param_name = message_param_name
         self._title_param_name = title_param_name
         self._target_param_name = target_param_name
         self._data = data
         self._data_template = data_template
+        self._data_plan = _compile_template_plan(hass, data)
+        self._data_template_plan = _compile_template_plan(hass, data_template)
+        # With no templates anywhere, the merged payload is the same for every
+        # message, so build it once and skip the render path entirely.
+        self._static_data: dict[str, Any] | None = None
+        if (data or data_template) and not (
+            self._data_plan[1] or self._data_template_plan[1]
+        ):
+            self._static_data = {**(data or {}), **(data_template or {})}
         self._auth = auth
         self._verify_ssl = verify_ssl
+        self._async_client: httpx.AsyncClient | None = None
 
-    def send_message(self, message="", **kwargs):
+    async def async_send_message(self, message="", **kwargs):
         """Send a message to a user."""
         data = {self._message_param_name: message}
 
@@ -157,77 +204,64 @@ class RestNotificationService(BaseNotificationService):
             # integrations, so just return the first target in the list.
             data[self._target_param_name] = kwargs[ATTR_TARGET][0]
 
-        if self._data_template or self._data:
+        if self._static_data is not None:
+            data.update(self._static_data)
+        elif self._data_template or self._data:
             kwargs[ATTR_MESSAGE] = message
 
-            def _data_template_creator(value):
-                """Recursive template creator helper function."""
-                if isinstance(value, list):
-                    return [_data_template_creator(item) for item in value]
-                if isinstance(value, dict):
-                    return {
-                        key: _data_template_creator(item) for key, item in value.items()
-                    }
-                if not isinstance(value, Template):
-                    return value
-                value.hass = self._hass
-                return value.async_render(kwargs, parse_result=False)
-
             if self._data:
-                data.update(_data_template_creator(self._data))
+                data.update(_render_template_plan(self._data_plan, kwargs))
             if self._data_template:
-                data.update(_data_template_creator(self._data_template))
+                data.update(_render_template_plan(self._data_template_plan, kwargs))
+
+        if not self._async_client:
+            self._async_client = get_async_client(
+                self._hass, verify_ssl=self._verify_ssl
+            )
 
         if self._method == "POST":
-            response = requests.post(
+            response = await self._async_client.post(
                 self._resource,
                 headers=self._headers,
                 params=self._params,
                 data=data,
                 timeout=10,
                 auth=self._auth,
-                verify=self._verify_ssl,
+                follow_redirects=True,
             )
         elif self._method == "POST_JSON":
-            response = requests.post(
+            response = await self._async_client.post(
                 self._resource,
                 headers=self._headers,
                 params=self._params,
                 json=data,
                 timeout=10,
                 auth=self._auth,
-                verify=self._verify_ssl,
+                follow_redirects=True,
             )
         else:  # default GET
-            response = requests.get(
+            if self._params:
+                params = dict(self._params)
+                params.update(data)
+            else:
+                params = data
+            response = await self._async_client.get(
                 self._resource,
                 headers=self._headers,
-                params={**self._params, **data} if self._params else data,
+                params=params,
                 timeout=10,
                 auth=self._auth,
-                verify=self._verify_ssl,
+                follow_redirects=True,
             )
 
-        if (
-            response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
-            and response.status_code < 600
-        ):
-            _LOGGER.exception(
-                "Server error. Response %d: %s:", response.status_code, response.reason
-            )
-        elif (
-            response.status_code >= HTTPStatus.BAD_REQUEST
-            and response.status_code < HTTPStatus.INTERNAL_SERVER_ERROR
-        ):
-            _LOGGER.exception(
-                "Client error. Response %d: %s:", response.status_code, response.reason
-            )
-        elif (
-            response.status_code >= HTTPStatus.OK
-            and response.status_code < HTTPStatus.MULTIPLE_CHOICES
-        ):
-            _LOGGER.debug(
-                "Success. Response %d: %s:", response.status_code, response.reason
-            )
+        status_code = response.status_code
+        reason = response.reason_phrase
+        status_class = status_code // 100
+        if status_class == 5:
+            _LOGGER.exception("Server error. Response %d: %s:", status_code, reason)
+        elif status_class == 4:
+            _LOGGER.exception("Client error. Response %d: %s:", status_code, reason)
+        elif status_class == 2:
+            _LOGGER.debug("Success. Response %d: %s:", status_code, reason)
         else:
-            _LOGGER.debug("Response %d: %s:", response.status_code, response.reason)
+            _LOGGER.debug("Response %d: %s:", status_code, reason)
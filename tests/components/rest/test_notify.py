@@ -1,4 +1,7 @@
 """The tests for the rest.notify platform."""
+from base64 import b64encode
+from http import HTTPStatus
+import json
 from unittest.mock import patch
 
 import respx
@@ -12,6 +15,19 @@ from homeassistant.setup import async_setup_component
 
 from tests.common import get_fixture_path
 
+RESOURCE = "http://127.0.0.1/notify"
+
+
+async def async_setup_notify(hass: HomeAssistant, config: dict) -> None:
+    """Set up the rest notify service with the given platform config."""
+    assert await async_setup_component(
+        hass,
+        notify.DOMAIN,
+        {notify.DOMAIN: [{"name": DOMAIN, "platform": DOMAIN, **config}]},
+    )
+    await hass.async_block_till_done()
+    assert hass.services.has_service(notify.DOMAIN, DOMAIN)
+
 
 @respx.mock
 async def test_reload_notify(hass: HomeAssistant) -> None:
@@ -48,3 +64,139 @@ async def test_reload_notify(hass: HomeAssistant) -> None:
 
     assert not hass.services.has_service(notify.DOMAIN, DOMAIN)
     assert hass.services.has_service(notify.DOMAIN, "rest_reloaded")
+
+
+@respx.mock
+async def test_send_message_get(hass: HomeAssistant) -> None:
+    """Test sending a message with GET merges params into the query string."""
+    route = respx.get(RESOURCE) % HTTPStatus.OK
+    await async_setup_notify(
+        hass,
+        {
+            "resource": RESOURCE,
+            "params": {"api_key": "secret"},
+            "title_param_name": "title",
+        },
+    )
+
+    await hass.services.async_call(
+        notify.DOMAIN,
+        DOMAIN,
+        {"message": "hello world", "title": "test"},
+        blocking=True,
+    )
+
+    assert route.called
+    params = route.calls.last.request.url.params
+    assert params["api_key"] == "secret"
+    assert params["message"] == "hello world"
+    assert params["title"] == "test"
+
+
+@respx.mock
+async def test_send_message_post(hass: HomeAssistant) -> None:
+    """Test sending a message with POST sends a form-encoded body."""
+    route = respx.post(RESOURCE) % HTTPStatus.OK
+    await async_setup_notify(hass, {"resource": RESOURCE, "method": "POST"})
+
+    await hass.services.async_call(
+        notify.DOMAIN, DOMAIN, {"message": "hello world"}, blocking=True
+    )
+
+    assert route.called
+    request = route.calls.last.request
+    assert request.headers["Content-Type"] == "application/x-www-form-urlencoded"
+    assert request.content == b"message=hello+world"
+
+
+@respx.mock
+async def test_send_message_post_json(hass: HomeAssistant) -> None:
+    """Test sending a message with POST_JSON sends a JSON body."""
+    route = respx.post(RESOURCE) % HTTPStatus.OK
+    await async_setup_notify(hass, {"resource": RESOURCE, "method": "POST_JSON"})
+
+    await hass.services.async_call(
+        notify.DOMAIN, DOMAIN, {"message": "hello world"}, blocking=True
+    )
+
+    assert route.called
+    request = route.calls.last.request
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == {"message": "hello world"}
+
+
+@respx.mock
+async def test_send_message_basic_auth(hass: HomeAssistant) -> None:
+    """Test sending a message with basic authentication configured."""
+    route = respx.get(RESOURCE) % HTTPStatus.OK
+    await async_setup_notify(
+        hass,
+        {"resource": RESOURCE, "username": "user", "password": "pass"},
+    )
+
+    await hass.services.async_call(
+        notify.DOMAIN, DOMAIN, {"message": "hello"}, blocking=True
+    )
+
+    assert route.called
+    authorization = route.calls.last.request.headers["Authorization"]
+    assert authorization == f"Basic {b64encode(b'user:pass').decode()}"
+
+
+@respx.mock
+async def test_send_message_rendered_data_templates(hass: HomeAssistant) -> None:
+    """Test templates nested in data/data_template render on every send."""
+    route = respx.get(RESOURCE) % HTTPStatus.OK
+    await async_setup_notify(
+        hass,
+        {
+            "resource": RESOURCE,
+            "title_param_name": "title",
+            "data": {
+                "static": "value",
+                "rendered": "msg={{ message }}",
+                "nested": ["first", "title={{ title }}"],
+            },
+            "data_template": {"templated": "{{ 1 + 1 }}"},
+        },
+    )
+
+    for message, title in (("hello", "one"), ("goodbye", "two")):
+        await hass.services.async_call(
+            notify.DOMAIN,
+            DOMAIN,
+            {"message": message, "title": title},
+            blocking=True,
+        )
+        params = route.calls.last.request.url.params
+        assert params["static"] == "value"
+        assert params["rendered"] == f"msg={message}"
+        assert params.get_list("nested") == ["first", f"title={title}"]
+        assert params["templated"] == "2"
+
+    assert len(route.calls) == 2
+
+
+@respx.mock
+async def test_send_message_static_data(hass: HomeAssistant) -> None:
+    """Test a template-free data tree is sent unchanged on every send."""
+    route = respx.get(RESOURCE) % HTTPStatus.OK
+    await async_setup_notify(
+        hass,
+        {
+            "resource": RESOURCE,
+            "data": {"first": "one"},
+            "data_template": {"second": "two"},
+        },
+    )
+
+    for message in ("hello", "goodbye"):
+        await hass.services.async_call(
+            notify.DOMAIN, DOMAIN, {"message": message}, blocking=True
+        )
+        params = route.calls.last.request.url.params
+        assert params["message"] == message
+        assert params["first"] == "one"
+        assert params["second"] == "two"
+
+    assert len(route.calls) == 2